@@ -5,11 +5,24 @@ A Sherlock-inspired tool to find social media accounts by username
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3.util.connection
 import json
+import re
 import time
 import sys
+import socket
+from urllib.parse import urlparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# Seconds a resolved platform host stays in the DNS cache
+DNS_TTL = 300
+
+# Error pages up to this many bytes are read to the end so their connection is reused
+DRAIN_LIMIT = 8192
+
+_create_connection = urllib3.util.connection.create_connection
+
 class Colors:
     RED = '\033[91m'
     GREEN = '\033[92m'
@@ -23,11 +36,20 @@ class Colors:
 
 class FindingNemo:
     def __init__(self):
+        self._dns_cache = {}
         self.platforms = self.load_platforms()
+        # Route urllib3 connects through the DNS cache so searches skip resolution
+        urllib3.util.connection.create_connection = self.create_connection
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
+        # One pooled connection per platform host, kept alive across searches
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
     def load_platforms(self):
         platforms = {
@@ -92,32 +114,82 @@ class FindingNemo:
                 "error": ["Page not found"]
             }
         }
+        # Compile each platform's indicators into one case-insensitive matcher over raw body bytes
+        for spec in platforms.values():
+            errors = [e.encode() for e in spec["error"]]
+            spec["error_re"] = re.compile(b"|".join(re.escape(e) for e in errors), re.IGNORECASE)
+            spec["error_overlap"] = max(len(e) for e in errors) - 1
+        
+        # Resolve the fixed platform hosts up front, in parallel
+        hosts = {urlparse(spec["url"]).hostname for spec in platforms.values()}
+        hosts = [host for host in hosts if "{}" not in host]
+        with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+            list(executor.map(self.resolve_host, hosts))
         return platforms
 
+    def resolve_host(self, host):
+        cached = self._dns_cache.get(host)
+        if cached and cached[1] > time.time():
+            return cached[0]
+        
+        try:
+            # Keep every address, in resolver order and limited to the families urllib3 allows
+            infos = socket.getaddrinfo(host, None, urllib3.util.connection.allowed_gai_family(),
+                                       socket.SOCK_STREAM)
+        except socket.gaierror:
+            # Let the real connect attempt report the failure
+            return [host]
+        ips = list(dict.fromkeys(info[4][0] for info in infos))
+        self._dns_cache[host] = (ips, time.time() + DNS_TTL)
+        return ips
+
+    def create_connection(self, address, *args, **kwargs):
+        host, port = address
+        # Fall back to the next cached address when one is unreachable, as urllib3 does
+        error = None
+        for ip in self.resolve_host(host):
+            try:
+                return _create_connection((ip, port), *args, **kwargs)
+            except OSError as e:
+                error = e
+        raise error
+
     def check_platform(self, platform, username):
         platform_data = self.platforms[platform]
         url = platform_data["url"].format(username)
         
         try:
-            response = self.session.get(url, timeout=10)
+            # Stream so a non-200 status or an early error match skips the rest of the body
+            response = self.session.get(url, timeout=10, stream=True)
             
-            if response.status_code == 200:
-                # Check for error indicators in response text
-                error_indicators = platform_data.get("error", [])
-                found = True
-                
-                for error in error_indicators:
-                    if error.lower() in response.text.lower():
-                        found = False
-                        break
-                
-                return platform, url, found, "Success"
-            else:
-                return platform, url, False, f"Status: {response.status_code}"
+            try:
+                if response.status_code == 200:
+                    found = not self.body_contains(
+                        response, platform_data["error_re"], platform_data["error_overlap"]
+                    )
+                    return platform, url, found, "Success"
+                else:
+                    # Most "not found" answers are short 404s; closing them unread would drop the connection
+                    length = response.headers.get('Content-Length', '')
+                    if length.isdigit() and int(length) <= DRAIN_LIMIT:
+                        response.content
+                    return platform, url, False, f"Status: {response.status_code}"
+            finally:
+                response.close()
                 
         except requests.exceptions.RequestException as e:
             return platform, url, False, f"Error: {str(e)}"
 
+    def body_contains(self, response, pattern, overlap):
+        # Search raw bytes; only the seam with the previous chunk is joined, never the whole chunk
+        tail = b""
+        for chunk in response.iter_content(chunk_size=65536):
+            if (tail and pattern.search(tail + chunk[:overlap])) or pattern.search(chunk):
+                return True
+            if overlap:
+                tail = chunk[-overlap:] if len(chunk) >= overlap else (tail + chunk)[-overlap:]
+        return False
+
     def print_banner(self):
         banner = f"""
 {Colors.CYAN}{Colors.BOLD}
@@ -137,23 +209,30 @@ class FindingNemo:
         """
         print(banner)
 
-    def print_result(self, platform, url, found, message):
+    def format_result(self, platform, url, found, message):
         if found:
             status = f"{Colors.GREEN}[ FOUND ]{Colors.RESET}"
-            print(f"{status} {Colors.BOLD}{platform}{Colors.RESET}")
-            print(f"     {Colors.CYAN}URL: {Colors.WHITE}{url}{Colors.RESET}")
+            return (f"{status} {Colors.BOLD}{platform}{Colors.RESET}\n"
+                    f"     {Colors.CYAN}URL: {Colors.WHITE}{url}{Colors.RESET}\n")
         else:
             status = f"{Colors.RED}[ NOT FOUND ]{Colors.RESET}"
-            print(f"{status} {Colors.BOLD}{platform}{Colors.RESET}")
+            return f"{status} {Colors.BOLD}{platform}{Colors.RESET}\n"
+
+    def write_results(self, buffer):
+        sys.stdout.write("".join(buffer))
+        sys.stdout.flush()
+        buffer.clear()
 
     def run_search(self, username):
         print(f"\n{Colors.YELLOW}[*] Searching for username: {Colors.BOLD}{username}{Colors.RESET}")
         print(f"{Colors.YELLOW}[*] Scanning {len(self.platforms)} platforms...{Colors.RESET}\n")
         
         found_count = 0
+        buffer = []
         start_time = time.time()
         
-        with ThreadPoolExecutor(max_workers=10) as executor:
+        # One worker per platform so every check is in flight at once
+        with ThreadPoolExecutor(max_workers=len(self.platforms)) as executor:
             future_to_platform = {
                 executor.submit(self.check_platform, platform, username): platform 
                 for platform in self.platforms
@@ -161,10 +240,14 @@ class FindingNemo:
             
             for future in as_completed(future_to_platform):
                 platform, url, found, message = future.result()
-                self.print_result(platform, url, found, message)
+                buffer.append(self.format_result(platform, url, found, message))
                 if found:
                     found_count += 1
+                # Write results in small batches instead of one print per line
+                if len(buffer) >= 4:
+                    self.write_results(buffer)
         
+        self.write_results(buffer)
         end_time = time.time()
         elapsed_time = end_time - start_time
         
@@ -1,58 +1,139 @@
 import socket
+import selectors
+import errno
+import struct
 import requests
 import json
 import time
 import threading
 from datetime import datetime
+from concurrent.futures import Future
 import sys
 import signal
-import subprocess
-import platform
 from urllib.parse import urlparse
 
+# Seconds a geolocation result stays cached
+GEO_TTL = 900
+
+# Seconds a reverse DNS result stays cached
+RDNS_TTL = 900
+
+# Ports checked by default in port_scan
+COMMON_PORTS = (80, 443, 22, 21, 25, 53, 110, 143, 993, 995)
+
+# Linger on with zero timeout: close() sends RST instead of leaving TIME_WAIT behind
+NO_LINGER = struct.pack('ii', 1, 0)
+
+def start_daemon(func, *args):
+    """Run func(*args) on a daemon thread and return a Future for its result.
+
+    Pool workers are joined at interpreter exit; daemon threads are not, so the
+    SIGINT handler's exit never waits for an in-flight probe to time out.
+    """
+    future = Future()
+    def run():
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
 class ServerInfoGatherer:
-    def __init__(self):
-        self.running = False
-        self.scan_count = 0
-        self.scanned_servers = set()
-        self.geo_cache = {}
-        
-    def print_banner(self):
-        banner = """
+    # Output frames are laid out once and only filled in per call
+    BANNER = """
 ╔══════════════════════════════════════════════════════════════════════╗
 ║                   SERVER INFORMATION GATHERER                       ║
 ║                 Comprehensive Data Collection Tool                  ║
 ╚══════════════════════════════════════════════════════════════════════╝
         """
-        print(banner)
     
-    def print_status(self):
-        status = f"""
+    STATUS_TEMPLATE = """
 ┌─────────────────── TOOL STATUS ───────────────────┐
-│  Running: {'YES' if self.running else 'NO':<10}                    │
-│  Servers Scanned: {self.scan_count:<8}                  │
-│  Unique Servers: {len(self.scanned_servers):<8}                    │
+│  Running: {running:<10}                    │
+│  Servers Scanned: {scans:<8}                  │
+│  Unique Servers: {servers:<8}                    │
 │  Press Ctrl+C to stop                              │
 └────────────────────────────────────────────────────┘
         """
-        print(status)
+    
+    GEO_TEMPLATE = """
+    ┌─ Geolocation Information ──────────────────────────┐
+    │ Country: {country:<40} │
+    │ Region: {region:<41} │
+    │ City: {city:<44} │
+    │ ISP: {isp:<44} │
+    │ Organization: {org:<34} │
+    │ AS: {asn:<45} │
+    └────────────────────────────────────────────────────┘"""
+    
+    PORTS_HEADER = "    ┌─ Open Ports & Services ───────────────────────────┐\n"
+    PORTS_ROW = "    │ {:<47} │\n"
+    PORTS_FOOTER = "    └────────────────────────────────────────────────────┘"
+    
+    HTTP_TEMPLATE = """
+    ┌─ Web Server Information ─────────────────────────┐
+    │ Protocol: {protocol:<40} │
+    │ Status: {status:<41} │
+    │ Server: {server:<41} │
+    └────────────────────────────────────────────────────┘"""
+    
+    SUMMARY_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════╗
+║                       FINAL SUMMARY                         ║
+╠══════════════════════════════════════════════════════════════╣
+║  Total Scans Performed: {scans:>20}            ║
+║  Unique Servers Found: {servers:>20}            ║
+║  Geolocation Queries: {queries:>21}            ║
+║                                                        ║
+║  Monitored Servers:                                      ║
+
+"""
+    SUMMARY_ROW = "║    {:2d}. {:<15} - {:<25} ║\n"
+    SUMMARY_FOOTER = """║                                                        ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+    
+    def __init__(self):
+        self.running = False
+        self.scan_count = 0
+        self.scanned_servers = {}
+        self.geo_cache = {}
+        self._rdns_cache = {}
+        # Guards writes to the shared caches and results; probes run on worker threads
+        self._state_lock = threading.Lock()
+        # Cycles between full scans; the cycles in between only recheck liveness and HTTP
+        self._full_scan_interval = 10
+        self._last_full = {}
+        
+    def print_banner(self):
+        print(self.BANNER)
+    
+    def print_status(self):
+        print(self.STATUS_TEMPLATE.format(running='YES' if self.running else 'NO',
+                                          scans=self.scan_count,
+                                          servers=len(self.scanned_servers)))
     
     def resolve_hostname(self, hostname):
         """Resolve hostname to IP address with additional info"""
         try:
-            # Get all address info
-            addr_info = socket.getaddrinfo(hostname, None)
-            ips = set()
+            # Get all address info in a single lookup
+            addr_info = socket.getaddrinfo(hostname, None, proto=socket.IPPROTO_TCP,
+                                           flags=socket.AI_CANONNAME)
+            ips = []
             for family, type, proto, canonname, sockaddr in addr_info:
-                ip = sockaddr[0]
-                ips.add(ip)
+                if sockaddr[0] not in ips:
+                    ips.append(sockaddr[0])
             
-            # Get primary IP
-            primary_ip = socket.gethostbyname(hostname)
+            # Primary IP is the first IPv4 address, since the scanners use IPv4 sockets
+            primary_ip = next((info[4][0] for info in addr_info if info[0] == socket.AF_INET), None)
+            if primary_ip is None:
+                return {'error': "DNS resolution failed: no IPv4 address"}
+            canonname = addr_info[0][3]
             
             return {
                 'primary_ip': primary_ip,
-                'all_ips': list(ips),
+                'all_ips': ips,
                 'hostname': hostname,
                 'canonical_name': canonname if canonname != hostname else None
             }
@@ -63,56 +144,116 @@ class ServerInfoGatherer:
     
     def get_geolocation(self, ip):
         """Get geolocation information for IP"""
-        if ip in self.geo_cache:
-            return self.geo_cache[ip]
+        cached = self.geo_cache.get(ip)
+        if cached and cached[1] > time.time():
+            return cached[0]
             
         try:
             response = requests.get(f"http://ip-api.com/json/{ip}", timeout=5)
             if response.status_code == 200:
                 data = response.json()
-                self.geo_cache[ip] = data
+                with self._state_lock:
+                    self.geo_cache[ip] = (data, time.time() + GEO_TTL)
                 return data
         except:
             pass
         return None
     
-    def port_scan(self, ip, ports=[80, 443, 22, 21, 25, 53, 110, 143, 993, 995]):
-        """Quick port scan for common services"""
-        open_ports = []
-        for port in ports:
+    def get_geolocations(self, ips):
+        """Get geolocation for several IPs using ip-api batch requests"""
+        now = time.time()
+        missing = [ip for ip in ips if ip not in self.geo_cache or self.geo_cache[ip][1] <= now]
+        
+        # The batch endpoint accepts up to 100 queries per request
+        for i in range(0, len(missing), 100):
             try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.settimeout(1)
-                    result = sock.connect_ex((ip, port))
-                    if result == 0:
-                        open_ports.append(port)
+                response = requests.post("http://ip-api.com/batch",
+                                         json=[{'query': ip} for ip in missing[i:i + 100]],
+                                         timeout=5)
+                if response.status_code == 200:
+                    expiry = time.time() + GEO_TTL
+                    results = response.json()
+                    with self._state_lock:
+                        for data in results:
+                            self.geo_cache[data.get('query')] = (data, expiry)
             except:
-                continue
-        return open_ports
+                pass
+        
+        return {ip: self.geo_cache[ip][0] for ip in ips if ip in self.geo_cache}
     
-    def get_service_info(self, ip, port):
-        """Get service banner information"""
+    def port_scan(self, ip, ports=None):
+        """Quick port scan for common services, returning connected sockets for open ports"""
+        ports = ports or COMMON_PORTS
+        open_socks = {}
+        selector = selectors.DefaultSelector()
+        sockets = []
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(2)
-                sock.connect((ip, port))
-                
-                # Try to receive banner
-                if port in [80, 443]:
-                    sock.send(b"HEAD / HTTP/1.0\r\n\r\n")
-                elif port == 22:
-                    sock.send(b"SSH-2.0-Client\r\n")
-                
-                banner = sock.recv(1024).decode('utf-8', errors='ignore')
-                return banner.strip()[:200]  # Limit banner length
+            # Start every connect at once and let the selector report completions
+            for port in ports:
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sockets.append(sock)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, NO_LINGER)
+                    sock.setblocking(False)
+                    result = sock.connect_ex((ip, port))
+                except:
+                    continue
+                if result == 0:
+                    open_socks[port] = sock
+                elif result in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+                    selector.register(sock, selectors.EVENT_WRITE, port)
+            
+            deadline = time.monotonic() + 1
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    selector.unregister(key.fileobj)
+                    if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        open_socks[key.data] = key.fileobj
+        finally:
+            selector.close()
+            # Open sockets stay connected so banners can be read without reconnecting
+            kept = set(open_socks.values())
+            for sock in sockets:
+                if sock not in kept:
+                    sock.close()
+        
+        return [(port, open_socks[port]) for port in ports if port in open_socks]
+    
+    def _banner_from_sock(self, sock, port):
+        """Read a service banner from a connected socket and close it"""
+        try:
+            sock.settimeout(2)
+            
+            # Try to receive banner
+            if port in [80, 443]:
+                sock.send(b"HEAD / HTTP/1.0\r\n\r\n")
+            elif port == 22:
+                sock.send(b"SSH-2.0-Client\r\n")
+            
+            banner = sock.recv(1024).decode('utf-8', errors='ignore')
+            return banner.strip()[:200]  # Limit banner length
         except:
             return None
+        finally:
+            sock.close()
+    
+    def fetch_headers(self, url):
+        """Fetch response headers without downloading the body"""
+        response = requests.head(url, timeout=5, allow_redirects=False)
+        if response.status_code == 405:
+            # HEAD not allowed, so stream a GET and drop it once headers arrive
+            response = requests.get(url, timeout=5, allow_redirects=False, stream=True)
+            response.close()
+        return response
     
     def get_http_headers(self, ip):
         """Get HTTP headers from web server"""
         try:
             # Try HTTP
-            response = requests.get(f"http://{ip}", timeout=5, allow_redirects=False)
+            response = self.fetch_headers(f"http://{ip}")
             return {
                 'status_code': response.status_code,
                 'headers': dict(response.headers),
@@ -122,7 +263,7 @@ class ServerInfoGatherer:
         except:
             try:
                 # Try HTTPS
-                response = requests.get(f"https://{ip}", timeout=5, allow_redirects=False)
+                response = self.fetch_headers(f"https://{ip}")
                 return {
                     'status_code': response.status_code,
                     'headers': dict(response.headers),
@@ -133,57 +274,64 @@ class ServerInfoGatherer:
                 return None
     
     def ping_server(self, ip):
-        """Ping server to check responsiveness"""
-        try:
-            param = "-n" if platform.system().lower() == "windows" else "-c"
-            command = ["ping", param, "2", ip]
-            result = subprocess.run(command, capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except:
-            return False
+        """Check server responsiveness with a TCP connect to the web ports"""
+        for port in (80, 443):
+            try:
+                with socket.create_connection((ip, port), timeout=1):
+                    return True
+            except ConnectionRefusedError:
+                # A reset still means the host answered
+                return True
+            except:
+                continue
+        return False
     
     def get_reverse_dns(self, ip):
         """Get reverse DNS (PTR) record"""
+        cached = self._rdns_cache.get(ip)
+        if cached and cached[1] > time.time():
+            return cached[0]
+        
         try:
             hostname = socket.gethostbyaddr(ip)[0]
-            return hostname
         except:
-            return None
+            hostname = None
+        # Missing PTR records are cached too, so they are not retried every cycle
+        with self._state_lock:
+            self._rdns_cache[ip] = (hostname, time.time() + RDNS_TTL)
+        return hostname
     
     def format_geolocation(self, geo_data):
         """Format geolocation information"""
         if not geo_data or geo_data.get('status') != 'success':
             return "Geolocation data unavailable"
         
-        return f"""
-    ┌─ Geolocation Information ──────────────────────────┐
-    │ Country: {geo_data.get('country', 'Unknown'):<40} │
-    │ Region: {geo_data.get('regionName', 'Unknown'):<41} │
-    │ City: {geo_data.get('city', 'Unknown'):<44} │
-    │ ISP: {geo_data.get('isp', 'Unknown'):<44} │
-    │ Organization: {geo_data.get('org', 'Unknown'):<34} │
-    │ AS: {geo_data.get('as', 'Unknown'):<45} │
-    └────────────────────────────────────────────────────┘"""
+        return self.GEO_TEMPLATE.format(country=geo_data.get('country', 'Unknown'),
+                                        region=geo_data.get('regionName', 'Unknown'),
+                                        city=geo_data.get('city', 'Unknown'),
+                                        isp=geo_data.get('isp', 'Unknown'),
+                                        org=geo_data.get('org', 'Unknown'),
+                                        asn=geo_data.get('as', 'Unknown'))
     
-    def format_port_info(self, ip, open_ports):
-        """Format port information"""
+    def format_port_info(self, open_ports):
+        """Format port information from (port, socket) scan results"""
         if not open_ports:
             return "    No common ports open"
         
+        # Each banner read can wait up to its timeout, so read them all at once
+        futures = [start_daemon(self._banner_from_sock, sock, port) for port, sock in open_ports]
+        banners = [future.result() for future in futures]
+        
         port_info = []
-        for port in open_ports:
+        for (port, _), banner in zip(open_ports, banners):
             service_name = self.get_service_name(port)
-            banner = self.get_service_info(ip, port)
             status = f"Port {port} ({service_name})"
             if banner:
                 status += f" - {banner.split(chr(10))[0][:50]}"
             port_info.append(status)
         
-        result = "    ┌─ Open Ports & Services ───────────────────────────┐\n"
-        for info in port_info:
-            result += f"    │ {info:<47} │\n"
-        result += "    └────────────────────────────────────────────────────┘"
-        return result
+        rows = "".join(self.PORTS_ROW.format(info) for info in port_info)
+        return self.PORTS_HEADER + rows + self.PORTS_FOOTER
     
     def get_service_name(self, port):
         """Get common service name for port"""
@@ -204,12 +352,7 @@ class ServerInfoGatherer:
         server_type = http_info.get('server', 'Unknown')
         status = http_info.get('status_code', 'Unknown')
         
-        return f"""
-    ┌─ Web Server Information ─────────────────────────┐
-    │ Protocol: {protocol:<40} │
-    │ Status: {status:<41} │
-    │ Server: {server_type:<41} │
-    └────────────────────────────────────────────────────┘"""
+        return self.HTTP_TEMPLATE.format(protocol=protocol, status=status, server=server_type)
     
     def gather_comprehensive_info(self, hostname):
         """Gather comprehensive information about server"""
@@ -228,42 +371,75 @@ class ServerInfoGatherer:
         if len(resolution['all_ips']) > 1:
             print(f"📡 All IPs: {', '.join(resolution['all_ips'])}")
         
+        def locate():
+            # Seed the geolocation cache for every address in one round trip
+            self.get_geolocations(resolution['all_ips'])
+            return self.get_geolocation(primary_ip)
+        
+        # The probes are independent, so run them together and print in the usual order
+        ping_future = start_daemon(self.ping_server, primary_ip)
+        rdns_future = start_daemon(self.get_reverse_dns, primary_ip)
+        geo_future = start_daemon(locate)
+        ports_future = start_daemon(self.port_scan, primary_ip)
+        http_future = start_daemon(self.get_http_headers, primary_ip)
+        
         # Basic connectivity
-        is_alive = self.ping_server(primary_ip)
+        is_alive = ping_future.result()
         status_icon = "🟢" if is_alive else "🔴"
         print(f"{status_icon} Server responsive: {'Yes' if is_alive else 'No'}")
         
         # Reverse DNS
-        reverse_dns = self.get_reverse_dns(primary_ip)
+        reverse_dns = rdns_future.result()
         if reverse_dns:
             print(f"🔁 Reverse DNS: {reverse_dns}")
         
         # Geolocation
-        geo_data = self.get_geolocation(primary_ip)
+        geo_data = geo_future.result()
         if geo_data:
             print(self.format_geolocation(geo_data))
         
         # Port scanning
         print("\n🔎 Scanning common ports...")
-        open_ports = self.port_scan(primary_ip)
-        print(self.format_port_info(primary_ip, open_ports))
+        open_ports = ports_future.result()
+        print(self.format_port_info(open_ports))
         
         # HTTP information
         print("\n🌐 Checking web services...")
-        http_info = self.get_http_headers(primary_ip)
+        http_info = http_future.result()
         print(self.format_http_info(http_info))
         
         return {
             'ip': primary_ip,
             'all_ips': resolution['all_ips'],
             'geolocation': geo_data,
-            'open_ports': open_ports,
+            'open_ports': [port for port, _ in open_ports],
             'http_info': http_info,
             'responsive': is_alive,
             'reverse_dns': reverse_dns,
             'timestamp': datetime.now().isoformat()
         }
     
+    def light_check(self, hostname):
+        """Recheck liveness and web service using the last full scan"""
+        last = self._last_full[hostname]
+        ip = last['ip']
+        print(f"\n⚡ Quick check for: {hostname} ({ip})")
+        print("─" * 60)
+        
+        ping_future = start_daemon(self.ping_server, ip)
+        http_future = start_daemon(self.get_http_headers, ip)
+        
+        is_alive = ping_future.result()
+        status_icon = "🟢" if is_alive else "🔴"
+        print(f"{status_icon} Server responsive: {'Yes' if is_alive else 'No'}")
+        
+        print("\n🌐 Checking web services...")
+        http_info = http_future.result()
+        print(self.format_http_info(http_info))
+        
+        return dict(last, responsive=is_alive, http_info=http_info,
+                    timestamp=datetime.now().isoformat())
+    
     def continuous_monitoring(self, hostname, interval=30):
         """Continuously monitor server and gather information"""
         print(f"🚀 Starting continuous monitoring for: {hostname}")
@@ -279,10 +455,16 @@ class ServerInfoGatherer:
                 print(f"\n🕐 Scan at: {timestamp}")
                 print("=" * 60)
                 
-                current_data = self.gather_comprehensive_info(hostname)
+                if self.scan_count % self._full_scan_interval == 0 or hostname not in self._last_full:
+                    current_data = self.gather_comprehensive_info(hostname)
+                    if current_data:
+                        self._last_full[hostname] = current_data
+                else:
+                    current_data = self.light_check(hostname)
                 
-                if current_data and current_data['ip'] not in self.scanned_servers:
-                    self.scanned_servers.add(current_data['ip'])
+                if current_data:
+                    with self._state_lock:
+                        self.scanned_servers[current_data['ip']] = current_data.get('geolocation') or {}
                 
                 self.scan_count += 1
                 
@@ -306,25 +488,15 @@ class ServerInfoGatherer:
     
     def print_final_summary(self):
         """Print final summary when tool stops"""
-        summary = f"""
-╔══════════════════════════════════════════════════════════════╗
-║                       FINAL SUMMARY                         ║
-╠══════════════════════════════════════════════════════════════╣
-║  Total Scans Performed: {self.scan_count:>20}            ║
-║  Unique Servers Found: {len(self.scanned_servers):>20}            ║
-║  Geolocation Queries: {len(self.geo_cache):>21}            ║
-║                                                        ║
-║  Monitored Servers:                                      ║
-"""
-        print(summary)
-        
-        for i, server in enumerate(self.scanned_servers, 1):
-            geo = self.geo_cache.get(server, {})
-            country = geo.get('country', 'Unknown')
-            print(f"║    {i:2d}. {server:<15} - {country:<25} ║")
+        parts = [self.SUMMARY_TEMPLATE.format(scans=self.scan_count,
+                                              servers=len(self.scanned_servers),
+                                              queries=len(self.geo_cache))]
+        for i, (server, geo) in enumerate(self.scanned_servers.items(), 1):
+            parts.append(self.SUMMARY_ROW.format(i, server, geo.get('country', 'Unknown')))
+        parts.append(self.SUMMARY_FOOTER)
         
-        print("║                                                        ║")
-        print("╚══════════════════════════════════════════════════════════════╝")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
     def signal_handler(self, signum, frame):
         """Handle interrupt signals"""
@@ -5,62 +5,198 @@ A beautiful and clean tool to gather server information and data from hidden pag
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import socket
 import json
-from bs4 import BeautifulSoup
+import io
+import re
+import html
+import functools
+import ipaddress
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, urlparse
 import colorama
-from colorama import Fore, Style
 import sys
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from concurrent.futures import Future
 
-# Initialize colorama for cross-platform colored output
-colorama.init(autoreset=True)
+# Every probe in a run targets the same host, so memoize name resolution process-wide
+_getaddrinfo = socket.getaddrinfo
 
-# Common hidden paths to check
-HIDDEN_PATHS = [
+@functools.lru_cache(maxsize=1024)
+def cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo with results cached per argument tuple."""
+    return _getaddrinfo(host, port, family, type, proto, flags)
+
+socket.getaddrinfo = cached_getaddrinfo
+
+class NoColor:
+    """Stand-in for colorama's Fore/Style that yields empty strings."""
+    def __getattr__(self, name):
+        return ''
+
+# Color only when writing to a terminal; redirected output skips colorama entirely
+if sys.stdout.isatty():
+    # Initialize colorama for cross-platform colored output
+    colorama.init(autoreset=True)
+    Fore, Style = colorama.Fore, colorama.Style
+else:
+    Fore = Style = NoColor()
+
+# Statuses that count as a hit. Directories commonly redirect to add a trailing
+# slash; a redirecting file is usually a login page, so files only count on 200/403
+DIR_STATUSES = frozenset({200, 301, 302, 403})
+FILE_STATUSES = frozenset({200, 403})
+
+# Common hidden paths to check; directories only need a HEAD, files are fetched
+_DIR_PATHS = [
     "admin", "dashboard", "login", "wp-admin", "phpmyadmin",
-    ".git", ".env", "backup", "api", "config", "uploads",
-    "administrator", "mysql", "test", "hidden", "cgi-bin",
-    "phpinfo.php", "robots.txt", ".htaccess", "backup.zip",
-    "wp-login.php", "administrator/index.php", "server-status"
+    ".git", "backup", "api", "config", "uploads",
+    "administrator", "mysql", "test", "hidden", "cgi-bin", "server-status"
+]
+_FILE_PATHS = [
+    ".env", "phpinfo.php", "robots.txt", ".htaccess", "backup.zip",
+    "wp-login.php", "administrator/index.php"
 ]
 
+# Paths stay relative to the target URL; a path is either a directory or a file, never both
+_DIR_PROBES = {path.lstrip('/'): ("HEAD", DIR_STATUSES) for path in _DIR_PATHS}
+_FILE_PROBES = {path.lstrip('/'): ("GET", FILE_STATUSES) for path in _FILE_PATHS}
+assert not _DIR_PROBES.keys() & _FILE_PROBES.keys(), "path listed as both directory and file"
+
+# (method, path, statuses) probes, one per canonical path
+HIDDEN_PROBES = tuple((method, path, statuses)
+                      for path, (method, statuses) in sorted({**_DIR_PROBES, **_FILE_PROBES}.items()))
+
+# Only hidden-field discovery needs a parse tree, so only <input> tags are kept
+PAGE_STRAINER = SoupStrainer('input')
+
+# Simple extractions are single regex sweeps over the raw page bytes
+_ATTR_VALUE = rb"""\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))"""
+COMMENT_RE = re.compile(rb'<!--(.*?)-->', re.DOTALL)
+TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+META_TAG_RE = re.compile(rb"""<meta\s(?:"[^"]*"|'[^']*'|[^"'>])*>""", re.IGNORECASE)
+META_NAME_RE = re.compile(rb'\sname' + _ATTR_VALUE, re.IGNORECASE)
+META_CONTENT_RE = re.compile(rb'\scontent' + _ATTR_VALUE, re.IGNORECASE)
+HREF_RE = re.compile(rb'<a(?:\s[^>]*?)?\shref' + _ATTR_VALUE, re.IGNORECASE)
+SCRIPT_SRC_RE = re.compile(rb'<script(?:\s[^>]*?)?\ssrc' + _ATTR_VALUE, re.IGNORECASE)
+
 # Common ports to scan
-COMMON_PORTS = [21, 22, 23, 25, 53, 80, 110, 443, 993, 995, 1723, 3306, 3389, 5900, 8080, 8443]
+COMMON_PORTS = tuple(sorted({21, 22, 23, 25, 53, 80, 110, 443, 993, 995, 1723, 3306, 3389, 5900, 8080, 8443}))
+
+def lookup_service(port):
+    """Look up the registered TCP service name for a port."""
+    try:
+        return socket.getservbyport(port, 'tcp')
+    except OSError:
+        return "unknown"
+
+# Service names for the scanned ports, read from the services database once
+PORT_SERVICES = {port: lookup_service(port) for port in COMMON_PORTS}
+
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+
+# (connect, read) timeouts for every HTTP request; with the one connect retry an
+# unreachable host fails after about 6 s, a half-open one after the 5 s read
+HTTP_TIMEOUT = (3, 5)
+
+# At most this much of a hit without a Content-Length is read to size it
+SIZE_READ_LIMIT = 64 * 1024
+
+# Output is queued here and written to stdout once per section
+_BUF = io.StringIO()
+
+# Stages running on worker threads queue into their own buffer instead
+_local = threading.local()
+
+# Message prefixes; every line ends with a reset, as autoreset did per print
+_OK = Fore.GREEN + '[+] '
+_WARN = Fore.YELLOW + '[!] '
+_ERR = Fore.RED + '[-] '
+_INFO = Fore.BLUE + '[*] '
+_EOL = Style.RESET_ALL + '\n'
+
+def _buffer():
+    """Return the calling stage's output buffer, or the shared one."""
+    return getattr(_local, 'buffer', _BUF)
+
+def emit(text=""):
+    """Queue a line of output."""
+    _buffer().write(text + _EOL)
+
+def flush():
+    """Write all queued output to stdout."""
+    if hasattr(_local, 'buffer'):
+        # Captured stage output is written by main() in stage order
+        return
+    sys.stdout.write(_BUF.getvalue())
+    _BUF.seek(0)
+    _BUF.truncate()
+    sys.stdout.flush()
+
+def start_daemon(func, *args):
+    """Run func(*args) on a daemon thread and return a Future for its result.
+
+    Pool workers are joined at interpreter exit; daemon threads are not, so Ctrl+C
+    exits right away instead of waiting for in-flight requests to time out.
+    """
+    future = Future()
+    def run():
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 def print_banner():
     """Print the tool banner."""
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}")
-    print("╔══════════════════════════════════════════════════════════════╗")
-    print("║               SERVER RECONNAISSANCE TOOL                    ║")
-    print("║                    For Termux Environment                   ║")
-    print("╚══════════════════════════════════════════════════════════════╝")
-    print(Style.RESET_ALL)
+    emit(f"\n{Fore.CYAN}{Style.BRIGHT}")
+    emit("╔══════════════════════════════════════════════════════════════╗")
+    emit("║               SERVER RECONNAISSANCE TOOL                    ║")
+    emit("║                    For Termux Environment                   ║")
+    emit("╚══════════════════════════════════════════════════════════════╝")
+    emit(Style.RESET_ALL)
 
 def print_header(title):
-    """Print a beautiful section header."""
-    print(f"\n{Fore.CYAN}{'='*60}")
-    print(f"{Style.BRIGHT}{title}")
-    print(f"{'='*60}{Style.RESET_ALL}")
+    """Print a beautiful section header, flushing the previous section."""
+    flush()
+    emit(f"\n{Fore.CYAN}{'='*60}")
+    emit(f"{Style.BRIGHT}{title}")
+    emit(f"{'='*60}{Style.RESET_ALL}")
 
 def print_success(message):
     """Print a success message."""
-    print(f"{Fore.GREEN}[+] {message}")
+    _buffer().write(_OK + message + _EOL)
 
 def print_warning(message):
     """Print a warning message."""
-    print(f"{Fore.YELLOW}[!] {message}")
+    _buffer().write(_WARN + message + _EOL)
 
 def print_error(message):
     """Print an error message."""
-    print(f"{Fore.RED}[-] {message}")
+    _buffer().write(_ERR + message + _EOL)
 
 def print_info(message):
     """Print an info message."""
-    print(f"{Fore.BLUE}[*] {message}")
+    _buffer().write(_INFO + message + _EOL)
+
+def create_session():
+    """Create the pooled HTTP session shared by all recon tasks."""
+    session = requests.Session()
+    # Few hosts (the target and its redirects), but enough connections for the path fan-out
+    # Retry a failed connect once and nothing else: reads, TLS errors, statuses and
+    # redirects are reported as they are, not waited on twice
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=30,
+                          max_retries=Retry(total=None, connect=1, read=0, other=0,
+                                            status=0, redirect=0))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
 
 def validate_url(url):
     """Validate and format the target URL."""
@@ -69,24 +205,27 @@ def validate_url(url):
         print_warning(f"Added http:// prefix. Using: {url}")
     return url
 
-def get_target():
+def get_target(session):
     """Get and validate target server from user input."""
     print_banner()
-    print(f"{Fore.YELLOW}NOTE: Only use this tool on servers you own or have permission to test!")
-    print(f"{Fore.RED}Unauthorized scanning is illegal and unethical!{Style.RESET_ALL}\n")
+    emit(f"{Fore.YELLOW}NOTE: Only use this tool on servers you own or have permission to test!")
+    emit(f"{Fore.RED}Unauthorized scanning is illegal and unethical!{Style.RESET_ALL}\n")
     
     while True:
+        flush()
         target = input(f"{Fore.WHITE}Enter target server (domain or IP): ").strip()
         if target:
             try:
                 validated_target = validate_url(target)
                 # Test if the target is reachable
                 print_info("Testing connection to target...")
-                response = requests.get(validated_target, timeout=10)
+                flush()
+                response = session.get(validated_target, timeout=HTTP_TIMEOUT)
                 print_success(f"Target is reachable! Status: {response.status_code}")
                 return validated_target
             except requests.exceptions.RequestException as e:
                 print_warning(f"Initial connection failed: {str(e)}")
+                flush()
                 choice = input("Continue anyway? (y/n): ").lower()
                 if choice == 'y':
                     return validated_target
@@ -95,21 +234,61 @@ def get_target():
         else:
             print_error("Please enter a valid target.")
 
-def get_server_info(url):
+def page_encoding(soup):
+    """Return the charset BeautifulSoup decoded the page with, for decoding regex matches."""
+    return (soup.original_encoding if soup is not None else None) or 'utf-8'
+
+def attr_text(match, encoding):
+    """Return the decoded, unescaped attribute value from an _ATTR_VALUE match."""
+    raw = next(group for group in match.groups() if group is not None)
+    return html.unescape(raw.decode(encoding, 'replace'))
+
+def meta_description(body, encoding):
+    """Return the description <meta> content, whatever order its attributes are in."""
+    for tag in META_TAG_RE.finditer(body):
+        name = META_NAME_RE.search(tag.group())
+        if name and attr_text(name, encoding).strip().lower() == 'description':
+            content = META_CONTENT_RE.search(tag.group())
+            return attr_text(content, encoding) if content else ""
+    return ""
+
+def fetch_root(session, url):
+    """Fetch and parse the target page once for every stage that inspects it."""
+    try:
+        response = session.get(url, timeout=HTTP_TIMEOUT)
+    except requests.exceptions.RequestException as e:
+        print_warning(f"Failed to fetch target page: {str(e)}")
+        return None, None
+    return response, BeautifulSoup(response.content, 'html.parser', parse_only=PAGE_STRAINER)
+
+def is_ip_literal(host):
+    """Tell whether a host is already an IPv4 or IPv6 address."""
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+@functools.lru_cache(maxsize=256)
+def resolve_host(hostname):
+    """Resolve a hostname to an IPv4 address, memoized for the run."""
+    return socket.gethostbyname(hostname)
+
+def get_server_info(hostname, response, ip_address, resolve_error=None):
     """Gather basic server and DNS information."""
     print_header("SERVER & DNS INFORMATION")
     
     try:
-        parsed_url = urlparse(url)
-        hostname = parsed_url.hostname
-        
-        # Get IP Address
-        ip_address = socket.gethostbyname(hostname)
-        print_success(f"IP Address: {ip_address}")
+        # IP Address, resolved once in main()
+        if ip_address:
+            print_success(f"IP Address: {ip_address}")
+        else:
+            print_error(f"Could not resolve {hostname}: {resolve_error}")
         
-        # Get Server Header from HTTP response
-        try:
-            response = requests.get(url, timeout=10)
+        # Get Server Header from the shared target response
+        if response is None:
+            print_error("HTTP request failed: target page unavailable")
+        else:
             print_success(f"HTTP Status: {response.status_code}")
             
             # Server headers
@@ -122,79 +301,83 @@ def get_server_info(url):
             for header in interesting_headers:
                 if header in response.headers:
                     print_info(f"{header}: {response.headers[header]}")
-                    
-        except Exception as e:
-            print_error(f"HTTP request failed: {str(e)}")
             
     except Exception as e:
         print_error(f"Server info gathering failed: {str(e)}")
 
-def scan_port(hostname, port):
-    """Scan a single port."""
+async def probe_port(ip, port):
+    """Try a TCP connect to a single port."""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex((hostname, port))
-        sock.close()
-        return port, result == 0
-    except:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=2)
+    except (OSError, asyncio.TimeoutError):
         return port, False
+    writer.close()
+    return port, True
 
-def port_scan(hostname):
-    """Perform a threaded port scan."""
+async def sweep_ports(ip, ports):
+    """Probe all ports concurrently on one event loop."""
+    return await asyncio.gather(*(probe_port(ip, port) for port in ports))
+
+def port_scan(ip):
+    """Perform a concurrent port scan against an IP literal, so no connect needs DNS."""
     print_header("PORT SCAN RESULTS")
-    print_info(f"Scanning {len(COMMON_PORTS)} common ports on {hostname}...")
+    if not ip:
+        print_error("Port scan skipped: target could not be resolved")
+        return
+    print_info(f"Scanning {len(COMMON_PORTS)} common ports on {ip}...")
     
     open_ports = []
     
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        futures = [executor.submit(scan_port, hostname, port) for port in COMMON_PORTS]
-        
-        for future in futures:
-            port, is_open = future.result()
-            if is_open:
-                open_ports.append(port)
-                # Get service name
-                try:
-                    service = socket.getservbyport(port, 'tcp')
-                except:
-                    service = "unknown"
-                print_success(f"Port {port}/tcp is OPEN - {service}")
+    for port, is_open in asyncio.run(sweep_ports(ip, COMMON_PORTS)):
+        if is_open:
+            open_ports.append(port)
+            service = PORT_SERVICES.get(port, "unknown")
+            print_success(f"Port {port}/tcp is OPEN - {service}")
     
     if open_ports:
         print_success(f"Found {len(open_ports)} open ports")
     else:
         print_info("No common open ports found.")
 
-def scrape_web_content(url):
-    """Scrape visible web content using BeautifulSoup."""
+def is_relative_href(href):
+    """Tell whether an href has no scheme or authority, so it stays on the page's host."""
+    if href.startswith('//'):
+        return False
+    return ':' not in href or href.startswith(('/', '?', '#', '.'))
+
+def scrape_web_content(url, base_netloc, response, encoding):
+    """Scrape visible web content with regex sweeps over the raw page."""
     print_header("WEB CONTENT ANALYSIS")
     
+    if response is None:
+        print_error("Web scraping failed: target page unavailable")
+        return
+    
     try:
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        body = response.content
         
         # Get Page Title
-        title = soup.title.string if soup.title else "No Title Found"
+        title_match = TITLE_RE.search(body)
+        title = html.unescape(title_match.group(1).decode(encoding, 'replace')).strip() if title_match else "No Title Found"
         print_success(f"Page Title: {title}")
         
         # Get Meta Description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            desc = meta_desc['content'][:100] + "..." if len(meta_desc['content']) > 100 else meta_desc['content']
+        content = meta_description(body, encoding)
+        if content:
+            desc = content[:100] + "..." if len(content) > 100 else content
             print_info(f"Meta Description: {desc}")
         
         # Get All Links
-        links = soup.find_all('a', href=True)
+        links = [attr_text(match, encoding) for match in HREF_RE.finditer(body)]
         print_info(f"Found {len(links)} links on the page.")
         
         # Categorize and display links
         internal_links = []
         external_links = []
-        
-        for link in links:
-            full_url = urljoin(url, link['href'])
-            if urlparse(full_url).netloc == urlparse(url).netloc:
+        for href in links:
+            full_url = urljoin(url, href)
+            # Most hrefs are relative; only absolute ones need a parse to compare hosts
+            if is_relative_href(href) or urlparse(full_url).netloc == base_netloc:
                 internal_links.append(full_url)
             else:
                 external_links.append(full_url)
@@ -202,60 +385,83 @@ def scrape_web_content(url):
         if internal_links:
             print_success(f"Internal links ({len(internal_links)}):")
             for link in internal_links[:5]:
-                print(f"  → {link}")
+                emit(f"  → {link}")
             if len(internal_links) > 5:
                 print_info(f"  ... and {len(internal_links) - 5} more internal links")
                 
         if external_links:
             print_warning(f"External links ({len(external_links)}):")
             for link in external_links[:3]:
-                print(f"  → {link}")
+                emit(f"  → {link}")
             
     except Exception as e:
         print_error(f"Web scraping failed: {str(e)}")
 
-def check_hidden_path(url, path):
-    """Check a single hidden path."""
-    test_url = urljoin(url, path)
+def check_hidden_path(session, method, test_url, statuses):
+    """Check a single hidden path with the probe's method.
+
+    Returns (url, status, size) for a hit, where size is a display string.
+    """
     try:
-        response = requests.get(test_url, timeout=5)
-        if response.status_code in [200, 301, 302, 403]:
-            return test_url, response.status_code, len(response.content)
+        if method == "HEAD":
+            response = session.head(test_url, timeout=HTTP_TIMEOUT, allow_redirects=False)
+            if response.status_code in statuses and 'Content-Length' in response.headers:
+                return test_url, response.status_code, f"{int(response.headers['Content-Length'])} bytes"
+            if response.status_code != 405 and response.status_code not in statuses:
+                return None
+        
+        # File probes, and HEAD probes that were refused or came back without a size.
+        # Streamed, so the size comes from the headers or a bounded read, never the whole body
+        with session.get(test_url, timeout=HTTP_TIMEOUT, allow_redirects=False, stream=True) as response:
+            if response.status_code in statuses:
+                size = int(response.headers.get('Content-Length') or 0)
+                if size:
+                    return test_url, response.status_code, f"{size} bytes"
+                # One byte past the limit tells a body that was cut off from one that fits exactly
+                size = len(response.raw.read(SIZE_READ_LIMIT + 1, decode_content=True))
+                if size > SIZE_READ_LIMIT:
+                    return test_url, response.status_code, f"≥{SIZE_READ_LIMIT // 1024} KiB"
+                return test_url, response.status_code, f"{size} bytes"
     except:
         pass
     return None
 
-def find_hidden_paths(url):
+def find_hidden_paths(session, url):
     """Brute-force common hidden directories and files using threading."""
     print_header("HIDDEN PATH DISCOVERY")
-    print_info(f"Checking {len(HIDDEN_PATHS)} common hidden paths...")
+    print_info(f"Checking {len(HIDDEN_PROBES)} common hidden paths...")
     
     found_paths = []
     
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(check_hidden_path, url, path) for path in HIDDEN_PATHS]
-        
-        for future in futures:
-            result = future.result()
-            if result:
-                test_url, status_code, content_length = result
-                found_paths.append(test_url)
-                
-                status_color = Fore.GREEN if status_code == 200 else Fore.YELLOW
-                print_success(f"Found: {test_url} (Status: {status_color}{status_code}{Style.RESET_ALL}, Size: {content_length} bytes)")
+    targets = [(method, urljoin(url, path), statuses) for method, path, statuses in HIDDEN_PROBES]
+    
+    # One thread per path (within the session's 30-connection pool) so the batch takes about one round trip
+    futures = [start_daemon(check_hidden_path, session, *target) for target in targets]
+    
+    for future in futures:
+        result = future.result()
+        if result:
+            test_url, status_code, size = result
+            found_paths.append(test_url)
+            
+            status_color = Fore.GREEN if status_code == 200 else Fore.YELLOW
+            print_success(f"Found: {test_url} (Status: {status_color}{status_code}{Style.RESET_ALL}, Size: {size})")
     
     if not found_paths:
         print_info("No common hidden paths found.")
     else:
         print_success(f"Found {len(found_paths)} accessible hidden paths!")
 
-def advanced_content_discovery(url):
+def advanced_content_discovery(url, response, soup):
     """Advanced discovery for hidden form fields and comments."""
     print_header("ADVANCED CONTENT DISCOVERY")
     
+    if soup is None:
+        print_error("Advanced discovery failed: target page unavailable")
+        return
+    
     try:
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        encoding = page_encoding(soup)
         
         # Find hidden input fields
         hidden_inputs = soup.find_all('input', type='hidden')
@@ -265,77 +471,115 @@ def advanced_content_discovery(url):
                 name = inp.get('name', 'unnamed')
                 value = inp.get('value', 'no value')
                 value_preview = value[:50] + "..." if len(value) > 50 else value
-                print(f"  - {name} = {value_preview}")
+                emit(f"  - {name} = {value_preview}")
         else:
             print_info("No hidden form fields found.")
         
-        # Find HTML comments
-        comments = soup.find_all(string=lambda text: isinstance(text, str) and '<!--' in text and '-->' in text)
+        # Find HTML comments in the raw page; the strained soup does not keep them
+        comments = COMMENT_RE.findall(response.content)
         if comments:
             print_info(f"Found {len(comments)} HTML comments:")
             for i, comment in enumerate(comments[:5]):  # Show first 5
-                clean_comment = ' '.join(comment.strip().split())
+                # Only the comments shown are decoded
+                clean_comment = ' '.join(comment.decode(encoding, 'replace').split())
                 preview = clean_comment[:100] + "..." if len(clean_comment) > 100 else clean_comment
-                print(f"  Comment {i+1}: {preview}")
+                emit(f"  Comment {i+1}: {preview}")
         else:
             print_info("No HTML comments found.")
             
         # Find JavaScript files
-        scripts = soup.find_all('script', src=True)
+        scripts = [attr_text(match, encoding) for match in SCRIPT_SRC_RE.finditer(response.content)]
         if scripts:
             print_info(f"Found {len(scripts)} external JavaScript files:")
-            for script in scripts[:3]:
-                print(f"  → {urljoin(url, script['src'])}")
+            for src in scripts[:3]:
+                emit(f"  → {urljoin(url, src)}")
                 
     except Exception as e:
         print_error(f"Advanced discovery failed: {str(e)}")
 
-def check_robots_txt(url):
+def check_robots_txt(session, url):
     """Check robots.txt for interesting paths."""
     print_header("ROBOTS.TXT ANALYSIS")
     
     robots_url = urljoin(url, '/robots.txt')
     try:
-        response = requests.get(robots_url, timeout=5)
-        if response.status_code == 200:
-            print_success("robots.txt found!")
-            lines = response.text.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#') and ('Disallow:' in line or 'Allow:' in line):
-                    print(f"  {line}")
-        else:
-            print_info("No robots.txt found or not accessible")
+        with session.get(robots_url, timeout=HTTP_TIMEOUT, stream=True) as response:
+            if response.status_code == 200:
+                print_success("robots.txt found!")
+                # iter_lines only decodes when an encoding is known
+                response.encoding = response.encoding or 'utf-8'
+                # Filter rules as lines arrive instead of splitting the whole body
+                for line in response.iter_lines(decode_unicode=True):
+                    line = line.strip()
+                    if line.startswith(('Disallow:', 'Allow:')):
+                        emit(f"  {line}")
+            else:
+                print_info("No robots.txt found or not accessible")
     except:
         print_info("Failed to fetch robots.txt")
 
+def run_stage(stage, *args):
+    """Run a recon stage on a worker thread and return its captured output."""
+    _local.buffer = io.StringIO()
+    try:
+        stage(*args)
+    except Exception as e:
+        print_error(f"{stage.__name__} failed: {str(e)}")
+    finally:
+        output = _local.buffer.getvalue()
+        del _local.buffer
+    return output
+
 def main():
     """Main function to run all reconnaissance tasks."""
+    session = create_session()
     try:
-        target = get_target()
+        target = get_target(session)
         parsed_url = urlparse(target)
         hostname = parsed_url.hostname
         
         print_info(f"Starting comprehensive reconnaissance on: {target}")
         start_time = time.time()
         
-        # Execute all reconnaissance functions
-        get_server_info(target)
-        port_scan(hostname)
-        scrape_web_content(target)
-        check_robots_txt(target)
-        find_hidden_paths(target)
-        advanced_content_discovery(target)
+        # The landing page is fetched and parsed once and shared by the stages below
+        flush()
+        root_resp, root_soup = fetch_root(session, target)
+        encoding = page_encoding(root_soup)
+        
+        # Resolve the target once, unless it already is an IP; the port scan connects to the IP directly
+        # A host that fails to resolve is reported by get_server_info; the other stages still run
+        ip, resolve_error = None, None
+        try:
+            ip = hostname if is_ip_literal(hostname) else resolve_host(hostname)
+        except (OSError, UnicodeError, TypeError) as e:
+            resolve_error = e
+        
+        # Execute all reconnaissance functions concurrently; besides the session they
+        # only share the read-only page and the IP
+        stages = [
+            (get_server_info, hostname, root_resp, ip, resolve_error),
+            (port_scan, ip),
+            (scrape_web_content, target, parsed_url.netloc, root_resp, encoding),
+            (check_robots_txt, session, target),
+            (find_hidden_paths, session, target),
+            (advanced_content_discovery, target, root_resp, root_soup),
+        ]
+        # Stages run on daemon threads, so Ctrl+C is not held up by their requests
+        futures = [start_daemon(run_stage, *stage) for stage in stages]
+        # Each section is printed, in the usual order, as soon as it and those before it finish
+        for future in futures:
+            _BUF.write(future.result())
+            flush()
         
         end_time = time.time()
         print_header("RECONNAISSANCE COMPLETE")
         print_success(f"All tasks finished in {end_time - start_time:.2f} seconds!")
-        print(f"\n{Fore.YELLOW}Summary Report:")
-        print(f"  Target: {target}")
-        print(f"  Hostname: {hostname}")
-        print(f"  Scan duration: {end_time - start_time:.2f} seconds")
-        print(f"\n{Fore.RED}Remember: Use this tool ethically and legally!")
-        print(f"{Fore.RED}Only scan systems you own or have explicit permission to test!")
+        emit(f"\n{Fore.YELLOW}Summary Report:")
+        emit(f"  Target: {target}")
+        emit(f"  Hostname: {hostname}")
+        emit(f"  Scan duration: {end_time - start_time:.2f} seconds")
+        emit(f"\n{Fore.RED}Remember: Use this tool ethically and legally!")
+        emit(f"{Fore.RED}Only scan systems you own or have explicit permission to test!")
         
     except KeyboardInterrupt:
         print_error("\nScan interrupted by user")
@@ -343,6 +587,9 @@ def main():
     except Exception as e:
         print_error(f"Unexpected error: {str(e)}")
         sys.exit(1)
+    finally:
+        flush()
+        session.close()
 
 if __name__ == "__main__":
     main()